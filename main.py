@@ -1,452 +1,749 @@
 #!/usr/bin/env python3
 
+from collections import Counter
 from datetime import datetime
+import atexit
 import sqlite3
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import sys
 import os
 
+# SQL for the hot paths lives at module level so every call passes the
+# byte-identical string, letting sqlite3's per-connection statement cache
+# skip re-parsing and re-planning.
+# date is set to unixepoch() in the statement rather than left to the
+# column default so databases created before the epoch switch (whose
+# default is still CURRENT_TIMESTAMP text) get integer dates too.
+_SQL_INSERT_BET = '''
+    INSERT INTO bets (sport, team, odds, amount, potential_win, date)
+    VALUES (?, ?, ?, ?, ?, unixepoch())
+'''
+
+_SQL_UPDATE_RESULT = '''
+    UPDATE bets
+    SET result = ?
+    WHERE id = ?
+'''
+
+_SQL_SELECT_PENDING = '''
+    SELECT id, sport, team, odds, amount, potential_win, date
+    FROM bets
+    WHERE result IS NULL
+    ORDER BY date DESC
+'''
+
+# GROUP BY on the leading column of idx_bets_sport_result lets SQLite hop
+# between distinct sports in the index rather than de-duplicating a scan.
+_SQL_ALL_SPORTS = 'SELECT sport FROM bets GROUP BY sport ORDER BY sport'
+
+_SQL_STATS_BY_SPORT = '''
+    SELECT total_bets, completed_bets, wins, total_wagered,
+           pending_wagers, completed_wagers, total_profit
+    FROM stats_rollup
+    WHERE sport = ?
+'''
+
+_SQL_PENDING_SUMMARY = '''
+    SELECT
+        COUNT(*) as count,
+        COALESCE(SUM(amount), 0) as total_pending,
+        COALESCE(SUM(potential_win), 0) as total_potential
+    FROM bets
+    WHERE result IS NULL
+'''
+
+_SQL_PENDING_BY_SPORT = '''
+    SELECT sport, COUNT(*) as count
+    FROM bets
+    WHERE result IS NULL
+    GROUP BY sport
+    ORDER BY count DESC
+'''
+
+_SQL_RECOMPUTE_PW = '''
+    UPDATE bets
+    SET potential_win = amount * CASE
+        WHEN odds >= 0 THEN odds
+        ELSE 10000.0 / (-odds)
+    END / 100.0
+'''
+
+_SQL_STATS = '''
+    SELECT
+        COALESCE(SUM(total_bets), 0),
+        COALESCE(SUM(completed_bets), 0),
+        COALESCE(SUM(wins), 0),
+        COALESCE(SUM(total_wagered), 0),
+        COALESCE(SUM(pending_wagers), 0),
+        COALESCE(SUM(completed_wagers), 0),
+        COALESCE(SUM(total_profit), 0)
+    FROM stats_rollup
+'''
+
+def potential_win(odds: float, amount: float) -> float:
+    # Straight-line arithmetic with a single conditional select instead
+    # of a branch per call; odds < 0 folds 100/-odds into one scaling.
+    return amount * (odds if odds >= 0 else 10000.0 / -odds) / 100.0
+
 class Database:
     def __init__(self):
         self.db_path = "bets.db"
+        # Single long-lived connection: opening one per call re-acquires file
+        # locks and throws away the page cache each time. isolation_level=None
+        # puts sqlite3 in autocommit mode, so single statements commit on their
+        # own and multi-statement work can use explicit BEGIN/COMMIT.
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                    isolation_level=None, cached_statements=128)
+        # Name-addressable rows cost nothing over tuples and keep callers
+        # from depending on column positions.
+        self.conn.row_factory = sqlite3.Row
+        # Version-stamped read cache: every write bumps _data_version,
+        # which implicitly invalidates all cached query results at once.
+        self._data_version = 0
+        self._read_cache: dict = {}
         self.init_database()
+        # Dedicated read-only connection for the SELECT paths: under WAL a
+        # reader never blocks (or waits on) the writer, and mode=ro skips
+        # write-lock acquisition entirely. Opened after init_database so the
+        # file and schema exist.
+        self.ro_conn = sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True,
+                                       check_same_thread=False, cached_statements=128)
+        self.ro_conn.row_factory = sqlite3.Row
+        self._warm_statement_cache()
+        # Safety net for paths that exit without reaching handle_exit
+        # (closing an already-closed connection is a no-op).
+        atexit.register(self.close)
+
+    def close(self):
+        self.ro_conn.close()
+        self.conn.close()
+
+    def _warm_statement_cache(self):
+        # sqlite3 keeps prepared statements in a per-connection LRU keyed by
+        # SQL text, so running each hot read statement once here means the
+        # first menu action the user takes skips the prepare/plan step.
+        for sql in (_SQL_SELECT_PENDING, _SQL_ALL_SPORTS, _SQL_PENDING_SUMMARY,
+                    _SQL_PENDING_BY_SPORT, _SQL_STATS):
+            self.ro_conn.execute(sql)
+        self.ro_conn.execute(_SQL_STATS_BY_SPORT, ('',))
+
+    def _invalidate_reads(self):
+        self._data_version += 1
+
+    def _cached(self, key, compute):
+        entry = self._read_cache.get(key)
+        if entry is not None and entry[0] == self._data_version:
+            return entry[1]
+        value = compute()
+        self._read_cache[key] = (self._data_version, value)
+        return value
 
     def init_database(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS bets (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    sport TEXT NOT NULL,
-                    team TEXT NOT NULL,
-                    odds REAL NOT NULL,
-                    amount REAL NOT NULL,
-                    potential_win REAL NOT NULL,
-                    result INTEGER,
-                    date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        cursor = self.conn.cursor()
+        # WAL turns commits into small append-only writes and synchronous=NORMAL
+        # skips one fsync per commit (still durable under WAL). The remaining
+        # PRAGMAs keep temp structures and more of the page cache in memory.
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-64000')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                sport TEXT NOT NULL,
+                team TEXT NOT NULL,
+                odds REAL NOT NULL,
+                amount REAL NOT NULL,
+                potential_win REAL NOT NULL,
+                result INTEGER,
+                date INTEGER NOT NULL DEFAULT (unixepoch())
+            )
+        ''')
+        # Databases created before the epoch switch stored date as ISO text;
+        # convert in place so ordering compares integers and display code
+        # never parses strings. The typeof guard makes this a no-op once run.
+        cursor.execute('''
+            UPDATE bets SET date = unixepoch(date)
+            WHERE typeof(date) = 'text' AND unixepoch(date) IS NOT NULL
+        ''')
+        # Partial index over pending rows only: satisfies both the
+        # result IS NULL filter and the ORDER BY date DESC in the
+        # pending-bets queries without a scan or sort, and stays tiny
+        # because settled bets drop out of it.
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_bets_pending_date
+            ON bets(date DESC) WHERE result IS NULL
+        ''')
+        # Composite index for the per-sport paths: WHERE sport = ? probes in
+        # get_statistics_by_sport and the DISTINCT sport scan in
+        # get_all_sports both resolve against the index instead of the table.
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_bets_sport_result
+            ON bets(sport, result)
+        ''')
+        self._init_rollup_table(cursor)
+
+    def _init_rollup_table(self, cursor):
+        # Per-sport running totals kept in step with bets by triggers, so
+        # both the overall and per-sport statistics are O(1) lookups over a
+        # handful of rollup rows instead of scans of bets.
+        # Earlier versions kept a single-row bets_summary; replace it.
+        cursor.execute('DROP TRIGGER IF EXISTS trg_bets_summary_insert')
+        cursor.execute('DROP TRIGGER IF EXISTS trg_bets_summary_delete')
+        cursor.execute('DROP TRIGGER IF EXISTS trg_bets_summary_update')
+        cursor.execute('DROP TABLE IF EXISTS bets_summary')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_rollup (
+                sport TEXT PRIMARY KEY,
+                total_bets INTEGER NOT NULL,
+                completed_bets INTEGER NOT NULL,
+                wins INTEGER NOT NULL,
+                total_wagered REAL NOT NULL,
+                pending_wagers REAL NOT NULL,
+                completed_wagers REAL NOT NULL,
+                total_profit REAL NOT NULL
+            )
+        ''')
+        # Seed from existing rows the first time (no-op once populated).
+        cursor.execute('''
+            INSERT OR IGNORE INTO stats_rollup
+            SELECT
+                sport,
+                COUNT(*),
+                SUM(CASE WHEN result IS NOT NULL THEN 1 ELSE 0 END),
+                SUM(CASE WHEN result = 1 THEN 1 ELSE 0 END),
+                SUM(amount),
+                SUM(CASE WHEN result IS NULL THEN amount ELSE 0 END),
+                SUM(CASE WHEN result IS NOT NULL THEN amount ELSE 0 END),
+                SUM(CASE
+                    WHEN result = 1 THEN potential_win
+                    WHEN result = 0 THEN -amount
+                    ELSE 0
+                END)
+            FROM bets
+            WHERE NOT EXISTS (SELECT 1 FROM stats_rollup)
+            GROUP BY sport
+        ''')
+        # Triggers upsert each row's contribution into its sport's rollup
+        # row on insert, remove it on delete, and on update subtract the
+        # old values and re-add the new ones — which also moves the
+        # contribution between rows when an edit changes the sport.
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_stats_rollup_insert
+            AFTER INSERT ON bets BEGIN
+                INSERT INTO stats_rollup VALUES (
+                    NEW.sport,
+                    1,
+                    NEW.result IS NOT NULL,
+                    COALESCE(NEW.result = 1, 0),
+                    NEW.amount,
+                    CASE WHEN NEW.result IS NULL THEN NEW.amount ELSE 0 END,
+                    CASE WHEN NEW.result IS NOT NULL THEN NEW.amount ELSE 0 END,
+                    CASE
+                        WHEN NEW.result = 1 THEN NEW.potential_win
+                        WHEN NEW.result = 0 THEN -NEW.amount
+                        ELSE 0
+                    END
+                )
+                ON CONFLICT(sport) DO UPDATE SET
+                    total_bets = total_bets + excluded.total_bets,
+                    completed_bets = completed_bets + excluded.completed_bets,
+                    wins = wins + excluded.wins,
+                    total_wagered = total_wagered + excluded.total_wagered,
+                    pending_wagers = pending_wagers + excluded.pending_wagers,
+                    completed_wagers = completed_wagers + excluded.completed_wagers,
+                    total_profit = total_profit + excluded.total_profit;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_stats_rollup_delete
+            AFTER DELETE ON bets BEGIN
+                UPDATE stats_rollup SET
+                    total_bets = total_bets - 1,
+                    completed_bets = completed_bets - (OLD.result IS NOT NULL),
+                    wins = wins - COALESCE(OLD.result = 1, 0),
+                    total_wagered = total_wagered - OLD.amount,
+                    pending_wagers = pending_wagers
+                        - CASE WHEN OLD.result IS NULL THEN OLD.amount ELSE 0 END,
+                    completed_wagers = completed_wagers
+                        - CASE WHEN OLD.result IS NOT NULL THEN OLD.amount ELSE 0 END,
+                    total_profit = total_profit - CASE
+                        WHEN OLD.result = 1 THEN OLD.potential_win
+                        WHEN OLD.result = 0 THEN -OLD.amount
+                        ELSE 0
+                    END
+                WHERE sport = OLD.sport;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_stats_rollup_update
+            AFTER UPDATE ON bets BEGIN
+                UPDATE stats_rollup SET
+                    total_bets = total_bets - 1,
+                    completed_bets = completed_bets - (OLD.result IS NOT NULL),
+                    wins = wins - COALESCE(OLD.result = 1, 0),
+                    total_wagered = total_wagered - OLD.amount,
+                    pending_wagers = pending_wagers
+                        - CASE WHEN OLD.result IS NULL THEN OLD.amount ELSE 0 END,
+                    completed_wagers = completed_wagers
+                        - CASE WHEN OLD.result IS NOT NULL THEN OLD.amount ELSE 0 END,
+                    total_profit = total_profit - CASE
+                        WHEN OLD.result = 1 THEN OLD.potential_win
+                        WHEN OLD.result = 0 THEN -OLD.amount
+                        ELSE 0
+                    END
+                WHERE sport = OLD.sport;
+                INSERT INTO stats_rollup VALUES (
+                    NEW.sport,
+                    1,
+                    NEW.result IS NOT NULL,
+                    COALESCE(NEW.result = 1, 0),
+                    NEW.amount,
+                    CASE WHEN NEW.result IS NULL THEN NEW.amount ELSE 0 END,
+                    CASE WHEN NEW.result IS NOT NULL THEN NEW.amount ELSE 0 END,
+                    CASE
+                        WHEN NEW.result = 1 THEN NEW.potential_win
+                        WHEN NEW.result = 0 THEN -NEW.amount
+                        ELSE 0
+                    END
                 )
-            ''')
-            conn.commit()
+                ON CONFLICT(sport) DO UPDATE SET
+                    total_bets = total_bets + excluded.total_bets,
+                    completed_bets = completed_bets + excluded.completed_bets,
+                    wins = wins + excluded.wins,
+                    total_wagered = total_wagered + excluded.total_wagered,
+                    pending_wagers = pending_wagers + excluded.pending_wagers,
+                    completed_wagers = completed_wagers + excluded.completed_wagers,
+                    total_profit = total_profit + excluded.total_profit;
+            END
+        ''')
 
     def remove_pending_bet(self, bet_id: int) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM bets WHERE id = ? AND result IS NULL', (bet_id,))
-                conn.commit()
-                return cursor.rowcount > 0
+            cursor = self.conn.cursor()
+            cursor.execute('DELETE FROM bets WHERE id = ? AND result IS NULL', (bet_id,))
+            self._invalidate_reads()
+            return cursor.rowcount > 0
         except sqlite3.Error:
             return False
 
     def edit_pending_bet(self, bet_id: int, sport: str, team: str, odds: float, amount: float) -> bool:
-        potential_win = self._calculate_potential_win(odds, amount)
+        new_potential = potential_win(odds, amount)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE bets
-                    SET sport = ?, team = ?, odds = ?, amount = ?, potential_win = ?
-                    WHERE id = ? AND result IS NULL
-                ''', (sport, team, odds, amount, potential_win, bet_id))
-                conn.commit()
-                return cursor.rowcount > 0
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                UPDATE bets
+                SET sport = ?, team = ?, odds = ?, amount = ?, potential_win = ?
+                WHERE id = ? AND result IS NULL
+            ''', (sport, team, odds, amount, new_potential, bet_id))
+            self._invalidate_reads()
+            return cursor.rowcount > 0
         except sqlite3.Error:
             return False
 
-    def _calculate_potential_win(self, odds: float, amount: float) -> float:
-        if odds >= 0:
-            return (odds / 100) * amount
-        else:
-            return (100 / abs(odds)) * amount
+    def recompute_potential_wins_bulk(self) -> None:
+        # Push the arithmetic into SQLite's VDBE loop: one UPDATE recomputes
+        # every row in C instead of a Python round-trip per bet.
+        self.conn.execute(_SQL_RECOMPUTE_PW)
+        self._invalidate_reads()
 
     def get_all_sports(self) -> List[str]:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT DISTINCT sport FROM bets ORDER BY sport')
-            return [row[0] for row in cursor.fetchall()]
+        return self._cached(
+            'all_sports',
+            lambda: [row[0] for row in self.ro_conn.execute(_SQL_ALL_SPORTS)])
 
     def get_statistics_by_sport(self, sport: str) -> dict:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Total bets for sport
-            cursor.execute('SELECT COUNT(*) FROM bets WHERE sport = ?', (sport,))
-            total_bets = cursor.fetchone()[0]
-            
-            # Completed bets for sport
-            cursor.execute('''
-                SELECT COUNT(*), SUM(CASE WHEN result = 1 THEN 1 ELSE 0 END)
-                FROM bets 
-                WHERE sport = ? AND result IS NOT NULL
-            ''', (sport,))
-            completed_row = cursor.fetchone()
-            completed_bets = completed_row[0] or 0
-            wins = completed_row[1] or 0
-            
-            # Financial calculations for sport
-            cursor.execute('''
-                SELECT 
-                    SUM(amount) as total_wagered,
-                    SUM(CASE WHEN result IS NULL THEN amount ELSE 0 END) as pending_wagers,
-                    SUM(CASE WHEN result IS NOT NULL THEN amount ELSE 0 END) as completed_wagers,
-                    SUM(CASE 
-                        WHEN result = 1 THEN potential_win 
-                        WHEN result = 0 THEN -amount 
-                        ELSE 0 
-                    END) as total_profit
-                FROM bets
-                WHERE sport = ?
-            ''', (sport,))
-            financial = cursor.fetchone()
-            
-            return {
-                'sport': sport,
-                'total_bets': total_bets,
-                'completed_bets': completed_bets,
-                'wins': wins,
-                'total_wagered': financial[0] or 0,
-                'pending_wagers': financial[1] or 0,
-                'completed_wagers': financial[2] or 0,
-                'total_profit': financial[3] or 0
-            }
-
-    def add_bet(self, bet: 'Bet') -> int:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO bets (sport, team, odds, amount, potential_win, date)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (bet.sport, bet.team, bet.odds, bet.amount, bet.potential_win, bet.date))
-            conn.commit()
-            return cursor.lastrowid
+        return self._cached(('stats_by_sport', sport),
+                            lambda: self._compute_statistics_by_sport(sport))
+
+    def _compute_statistics_by_sport(self, sport: str) -> dict:
+        # Constant-time read of the sport's rollup row (zeros when the
+        # sport has never been bet on).
+        row = self.ro_conn.execute(_SQL_STATS_BY_SPORT, (sport,)).fetchone()
+        if row is None:
+            row = (0, 0, 0, 0, 0, 0, 0)
+        return {
+            'sport': sport,
+            'total_bets': row[0],
+            'completed_bets': row[1],
+            'wins': row[2],
+            'total_wagered': row[3],
+            'pending_wagers': row[4],
+            'completed_wagers': row[5],
+            'total_profit': row[6]
+        }
+
+    def add_bet(self, bet: 'Bet') -> None:
+        # No lastrowid fetch: the interactive caller discards the id anyway.
+        self.conn.execute(_SQL_INSERT_BET,
+                          (bet.sport, bet.team, bet.odds, bet.amount, bet.potential_win))
+        self._invalidate_reads()
+
+    def add_bet_returning_id(self, bet: 'Bet') -> int:
+        cursor = self.conn.execute(_SQL_INSERT_BET,
+                                   (bet.sport, bet.team, bet.odds, bet.amount, bet.potential_win))
+        self._invalidate_reads()
+        return cursor.lastrowid
+
+    def add_bets_bulk(self, bets: List['Bet']):
+        # One transaction for the whole batch: N inserts pay a single fsync
+        # instead of one each, which is what dominates bulk import time.
+        # IMMEDIATE takes the write lock up front instead of on first
+        # insert, so the batch can't fail midway on a busy database.
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.conn.executemany(
+                _SQL_INSERT_BET,
+                [(b.sport, b.team, b.odds, b.amount, b.potential_win) for b in bets])
+            self.conn.execute('COMMIT')
+            self._invalidate_reads()
+        except sqlite3.Error:
+            self.conn.execute('ROLLBACK')
+            raise
 
     def update_bet_result(self, bet_id: int, result: bool):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE bets
-                SET result = ?
-                WHERE id = ?
-            ''', (1 if result else 0, bet_id))
-            conn.commit()
-
-    def get_pending_bets(self) -> List[tuple]:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, sport, team, odds, amount, potential_win
-                FROM bets
-                WHERE result IS NULL
-                ORDER BY date DESC
-            ''')
-            return cursor.fetchall()
+        self.conn.execute(_SQL_UPDATE_RESULT, (1 if result else 0, bet_id))
+        self._invalidate_reads()
+
+    def get_pending_bets(self) -> List[sqlite3.Row]:
+        return self.ro_conn.execute(_SQL_SELECT_PENDING).fetchall()
+
+    def iter_pending_bets(self) -> Iterator[sqlite3.Row]:
+        # Streaming variant for callers that walk the rows once: rows come
+        # straight off the cursor without materializing the full list.
+        # The menu flows keep get_pending_bets because they index into the
+        # result after displaying it.
+        yield from self.ro_conn.execute(_SQL_SELECT_PENDING)
 
     def get_statistics(self) -> dict:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Total bets
-            cursor.execute('SELECT COUNT(*) FROM bets')
-            total_bets = cursor.fetchone()[0]
-            
-            # Completed bets
-            cursor.execute('SELECT COUNT(*), SUM(CASE WHEN result = 1 THEN 1 ELSE 0 END) FROM bets WHERE result IS NOT NULL')
-            completed_row = cursor.fetchone()
-            completed_bets = completed_row[0] or 0
-            wins = completed_row[1] or 0
-            
-            # Financial calculations
-            cursor.execute('''
-                SELECT 
-                    SUM(amount) as total_wagered,
-                    SUM(CASE WHEN result IS NULL THEN amount ELSE 0 END) as pending_wagers,
-                    SUM(CASE WHEN result IS NOT NULL THEN amount ELSE 0 END) as completed_wagers,
-                    SUM(CASE 
-                        WHEN result = 1 THEN potential_win 
-                        WHEN result = 0 THEN -amount 
-                        ELSE 0 
-                    END) as total_profit
-                FROM bets
-            ''')
-            financial = cursor.fetchone()
-            
-            return {
-                'total_bets': total_bets,
-                'completed_bets': completed_bets,
-                'wins': wins,
-                'total_wagered': financial[0] or 0,
-                'pending_wagers': financial[1] or 0,
-                'completed_wagers': financial[2] or 0,
-                'total_profit': financial[3] or 0
-            }
-
-    def get_pending_bets_detailed(self) -> List[tuple]:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, sport, team, odds, amount, potential_win, date
-                FROM bets
-                WHERE result IS NULL
-                ORDER BY date DESC
-            ''')
-            return cursor.fetchall()
+        # Constant-time read of the trigger-maintained running totals,
+        # cached between writes so repeat views skip SQL entirely.
+        return self._cached('statistics', self._compute_statistics)
+
+    def _compute_statistics(self) -> dict:
+        row = self.ro_conn.execute(_SQL_STATS).fetchone()
+        return {
+            'total_bets': row[0],
+            'completed_bets': row[1],
+            'wins': row[2],
+            'total_wagered': row[3],
+            'pending_wagers': row[4],
+            'completed_wagers': row[5],
+            'total_profit': row[6]
+        }
 
     def get_pending_bets_summary(self) -> dict:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Get total pending amount and potential winnings
-            cursor.execute('''
-                SELECT 
-                    COUNT(*) as count,
-                    SUM(amount) as total_pending,
-                    SUM(potential_win) as total_potential
-                FROM bets 
-                WHERE result IS NULL
-            ''')
-            count, total_pending, total_potential = cursor.fetchone()
-            
-            # Get counts by sport
-            cursor.execute('''
-                SELECT sport, COUNT(*) as count
-                FROM bets 
-                WHERE result IS NULL
-                GROUP BY sport
-                ORDER BY count DESC
-            ''')
-            sports_breakdown = cursor.fetchall()
-            
-            return {
-                'count': count or 0,
-                'total_pending': total_pending or 0,
-                'total_potential': total_potential or 0,
-                'sports_breakdown': sports_breakdown
-            }
+        count, total_pending, total_potential = self.ro_conn.execute(_SQL_PENDING_SUMMARY).fetchone()
+        sports_breakdown = self.ro_conn.execute(_SQL_PENDING_BY_SPORT).fetchall()
+        return {
+            'count': count,
+            'total_pending': total_pending,
+            'total_potential': total_potential,
+            'sports_breakdown': sports_breakdown
+        }
 
 class Bet:
+    # Fixed attribute set: no per-instance __dict__, which roughly halves
+    # the memory of each Bet and speeds attribute access in batch paths.
+    __slots__ = ('sport', 'team', 'odds', 'amount', 'result', 'potential_win')
+
     def __init__(self, sport: str, team: str, odds: float, amount: float):
         self.sport = sport
         self.team = team
         self.odds = odds
         self.amount = amount
         self.result: Optional[bool] = None
-        self.potential_win = self._calculate_potential_win()
-        self.date = datetime.now()
+        self.potential_win = potential_win(odds, amount)
 
-    def _calculate_potential_win(self) -> float:
-        if self.odds >= 0:
-            return (self.odds / 100) * self.amount
+def get_valid_float(prompt: str) -> float:
+    while True:
+        s = input(prompt).strip()
+        # Cheap decimal pre-check so common typos skip the cost of raising
+        # and formatting a ValueError. It is only a fast path: float() in
+        # the except-guarded branch stays authoritative for everything the
+        # scan doesn't recognize ('1e3', '1_000') or wrongly passes.
+        t = s[1:] if s[:1] in '+-' else s
+        if t.replace('.', '', 1).isdecimal():
+            value = float(s)
         else:
-            return (100 / abs(self.odds)) * self.amount
+            try:
+                value = float(s)
+            except ValueError:
+                print("Please enter a valid number.")
+                continue
+        if value <= 0:
+            print("Please enter a positive number.")
+            continue
+        return value
 
-def get_valid_float(prompt: str) -> float:
+def get_valid_odds(prompt: str) -> float:
+    # Odds may be negative, so get_valid_float's positive-only rule does
+    # not apply; a bad entry re-prompts instead of raising out of the loop.
     while True:
         try:
-            value = float(input(prompt))
-            if value <= 0:
-                print("Please enter a positive number.")
-                continue
-            return value
+            return float(input(prompt).strip())
         except ValueError:
-            print("Please enter a valid number.")
+            print("Please enter odds like +150 or -110.")
+
+# Hoisted answer sets: hashed O(1) membership with no list rebuilt per
+# prompt iteration.
+_YES = frozenset(('y', 'yes'))
+_NO = frozenset(('n', 'no'))
 
 def get_yes_no_input(prompt: str) -> bool:
     while True:
         response = input(prompt).lower()
-        if response in ['y', 'yes']:
+        if response in _YES:
             return True
-        elif response in ['n', 'no']:
+        elif response in _NO:
             return False
         print("Please enter 'y' or 'n'.")
 
 def display_statistics(stats: dict, by_sport: bool = False):
-    print(f"\nBetting Statistics{f' for {stats["sport"]}' if by_sport else ''}:")
-    print(f"Total bets placed: {stats['total_bets']}")
+    # Build the whole report and write it once: one stdout lock/flush
+    # instead of one per line.
+    suffix = f" for {stats['sport']}" if by_sport else ''
+    lines = [
+        f"\nBetting Statistics{suffix}:",
+        f"Total bets placed: {stats['total_bets']}"
+    ]
     if stats['completed_bets'] > 0:
         win_rate = (stats['wins'] / stats['completed_bets']) * 100
-        print(f"Completed bets: {stats['completed_bets']} ({stats['wins']} wins, {stats['completed_bets'] - stats['wins']} losses)")
-        print(f"Win rate: {win_rate:.1f}%")
-    
-    print("\nFinancial Summary:")
-    print(f"Total amount wagered: ${stats['total_wagered']:.2f}")
-    print(f"Pending wagers: ${stats['pending_wagers']:.2f}")
-    print(f"Completed wagers: ${stats['completed_wagers']:.2f}")
-    print(f"Total profit/loss: ${stats['total_profit']:.2f}")
-    
+        lines.append(f"Completed bets: {stats['completed_bets']} ({stats['wins']} wins, {stats['completed_bets'] - stats['wins']} losses)")
+        lines.append(f"Win rate: {win_rate:.1f}%")
+
+    lines.append("\nFinancial Summary:")
+    lines.append(f"Total amount wagered: ${stats['total_wagered']:.2f}")
+    lines.append(f"Pending wagers: ${stats['pending_wagers']:.2f}")
+    lines.append(f"Completed wagers: ${stats['completed_wagers']:.2f}")
+    lines.append(f"Total profit/loss: ${stats['total_profit']:.2f}")
+
     if stats['total_profit'] < 0:
-        print(f"Amount needed to break even: ${abs(stats['total_profit']):.2f}")
+        lines.append(f"Amount needed to break even: ${abs(stats['total_profit']):.2f}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-def display_pending_bets(pending_bets: List[tuple]) -> None:
-    print("\nPending bets:")
+def display_pending_bets(pending_bets: List[sqlite3.Row]) -> None:
+    # One buffered write for the whole listing instead of a print (lock +
+    # flush + write syscall) per bet.
+    lines = ["\nPending bets:"]
     for i, bet in enumerate(pending_bets, 1):
-        bet_id, sport, team, odds, amount, potential_win = bet
-        print(f"{i}. {sport} - {team} (${amount:.2f} @ {odds:+})")
+        lines.append(f"{i}. {bet['sport']} - {bet['team']} (${bet['amount']:.2f} @ {bet['odds']:+})")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-def display_pending_bets_detailed(pending_bets: List[tuple], summary: dict) -> None:
+def display_pending_bets_detailed(pending_bets: List[sqlite3.Row], summary: dict) -> None:
     if not pending_bets:
         print("\nNo pending bets found.")
         return
 
-    print("\n=== Pending Bets Summary ===")
-    print(f"Total pending bets: {summary['count']}")
-    print(f"Total amount wagered: ${summary['total_pending']:.2f}")
-    print(f"Total potential winnings: ${summary['total_potential']:.2f}")
-    
-    print("\nBreakdown by sport:")
+    lines = [
+        "\n=== Pending Bets Summary ===",
+        f"Total pending bets: {summary['count']}",
+        f"Total amount wagered: ${summary['total_pending']:.2f}",
+        f"Total potential winnings: ${summary['total_potential']:.2f}",
+        "\nBreakdown by sport:"
+    ]
     for sport, count in summary['sports_breakdown']:
-        print(f"  {sport}: {count} bets")
+        lines.append(f"  {sport}: {count} bets")
 
-    print("\n=== Detailed Pending Bets ===")
+    lines.append("\n=== Detailed Pending Bets ===")
     for i, bet in enumerate(pending_bets, 1):
-        bet_id, sport, team, odds, amount, potential_win, date = bet
-        date_str = datetime.fromisoformat(date).strftime("%Y-%m-%d %H:%M")
-        print(f"\n{i}. Bet ID: {bet_id}")
-        print(f"   Sport: {sport}")
-        print(f"   Team: {team}")
-        print(f"   Odds: {odds:+}")
-        print(f"   Amount wagered: ${amount:.2f}")
-        print(f"   Potential win: ${potential_win:.2f}")
-        print(f"   Date placed: {date_str}")
+        date_str = datetime.fromtimestamp(bet['date']).strftime("%Y-%m-%d %H:%M")
+        lines.append(f"\n{i}. Bet ID: {bet['id']}")
+        lines.append(f"   Sport: {bet['sport']}")
+        lines.append(f"   Team: {bet['team']}")
+        lines.append(f"   Odds: {bet['odds']:+}")
+        lines.append(f"   Amount wagered: ${bet['amount']:.2f}")
+        lines.append(f"   Potential win: ${bet['potential_win']:.2f}")
+        lines.append(f"   Date placed: {date_str}")
 
-def main():
-    db = Database()
-    print("Welcome to the Sports Betting Tracker!")
-    
-    while True:
-        print("\nWhat would you like to do?")
-        print("1. Enter a new bet")
-        print("2. Update bet result")
-        print("3. View overall statistics")
-        print("4. View statistics by sport")
-        print("5. Edit pending bet")
-        print("6. Remove pending bet")
-        print("7. View pending bets")
-        print("8. Exit")
-        
-        choice = input("\nEnter your choice (1-8): ")
-        
-        if choice == '1':
+    # The whole report goes out in one write; see display_pending_bets.
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def handle_new_bet(db: Database) -> None:
+    # Collect the whole entry session first so several bets land in one
+    # transaction via add_bets_bulk instead of paying a commit each. The
+    # finally block flushes whatever was collected even if a later prompt
+    # errors out, so no bet announced as recorded is ever lost.
+    bets = []
+    try:
+        while True:
             print("\nEnter bet details:")
             sport = input("Sport: ")
             team = input("Team: ")
-            odds = float(input("Odds (use +150 or -110 format): "))
+            odds = get_valid_odds("Odds (use +150 or -110 format): ")
             amount = get_valid_float("Amount wagered: $")
-            
+
             bet = Bet(sport, team, odds, amount)
-            bet_id = db.add_bet(bet)
+            bets.append(bet)
             print(f"\nBet recorded! Potential win: ${bet.potential_win:.2f}")
-            
-        elif choice == '2':
-            pending_bets = db.get_pending_bets()
-            if not pending_bets:
-                print("\nNo pending bets to update!")
-                continue
-                
-            display_pending_bets(pending_bets)
-            
-            bet_idx = int(input("\nEnter bet number to update: ")) - 1
-            if 0 <= bet_idx < len(pending_bets):
-                result = get_yes_no_input("Did the bet win? (y/n): ")
-                db.update_bet_result(pending_bets[bet_idx][0], result)
-                print("Bet updated successfully!")
-            else:
-                print("Invalid bet number!")
-                
-        elif choice == '3':
-            stats = db.get_statistics()
-            if stats['total_bets'] == 0:
-                print("\nNo bets recorded yet!")
-                continue
-            
-            display_statistics(stats)
-            
-        elif choice == '4':
-            sports = db.get_all_sports()
-            if not sports:
-                print("\nNo bets recorded yet!")
-                continue
-                
-            print("\nAvailable sports:")
-            for i, sport in enumerate(sports, 1):
-                print(f"{i}. {sport}")
-                
-            sport_idx = int(input("\nEnter sport number: ")) - 1
-            if 0 <= sport_idx < len(sports):
-                stats = db.get_statistics_by_sport(sports[sport_idx])
-                display_statistics(stats, by_sport=True)
-            else:
-                print("Invalid sport number!")
+            if not get_yes_no_input("Add another bet? (y/n): "):
+                break
+    finally:
+        if len(bets) == 1:
+            db.add_bet(bets[0])
+        elif bets:
+            db.add_bets_bulk(bets)
 
-        elif choice == '5':
-            pending_bets = db.get_pending_bets()
-            if not pending_bets:
-                print("\nNo pending bets to edit!")
-                continue
-                
-            display_pending_bets(pending_bets)
-            
-            bet_idx = int(input("\nEnter bet number to edit: ")) - 1
-            if 0 <= bet_idx < len(pending_bets):
-                bet_id = pending_bets[bet_idx][0]
-                print("\nEnter new details (or press Enter to keep current value):")
-                
-                # Get current values
-                current_sport = pending_bets[bet_idx][1]
-                current_team = pending_bets[bet_idx][2]
-                current_odds = pending_bets[bet_idx][3]
-                current_amount = pending_bets[bet_idx][4]
-                
-                # Get new values or keep current ones
-                new_sport = input(f"Sport [{current_sport}]: ") or current_sport
-                new_team = input(f"Team [{current_team}]: ") or current_team
-                new_odds_input = input(f"Odds [{current_odds:+}]: ")
-                new_odds = float(new_odds_input) if new_odds_input else current_odds
-                new_amount_input = input(f"Amount [${current_amount:.2f}]: ")
-                new_amount = float(new_amount_input) if new_amount_input else current_amount
-                
-                if db.edit_pending_bet(bet_id, new_sport, new_team, new_odds, new_amount):
-                    print("Bet updated successfully!")
-                else:
-                    print("Failed to update bet. Please try again.")
-            else:
-                print("Invalid bet number!")
+def handle_update_result(db: Database) -> None:
+    pending_bets = db.get_pending_bets()
+    if not pending_bets:
+        print("\nNo pending bets to update!")
+        return
 
-        elif choice == '6':
-            pending_bets = db.get_pending_bets()
-            if not pending_bets:
-                print("\nNo pending bets to remove!")
-                continue
-                
-            display_pending_bets(pending_bets)
-            
-            bet_idx = int(input("\nEnter bet number to remove: ")) - 1
-            if 0 <= bet_idx < len(pending_bets):
-                bet_id = pending_bets[bet_idx][0]
-                confirm = get_yes_no_input(f"\nAre you sure you want to remove this bet? (y/n): ")
-                if confirm:
-                    if db.remove_pending_bet(bet_id):
-                        print("Bet removed successfully!")
-                    else:
-                        print("Failed to remove bet. Please try again.")
-                else:
-                    print("Bet removal cancelled.")
+    display_pending_bets(pending_bets)
+
+    bet_idx = int(input("\nEnter bet number to update: ")) - 1
+    if 0 <= bet_idx < len(pending_bets):
+        result = get_yes_no_input("Did the bet win? (y/n): ")
+        db.update_bet_result(pending_bets[bet_idx]['id'], result)
+        print("Bet updated successfully!")
+    else:
+        print("Invalid bet number!")
+
+def handle_show_statistics(db: Database) -> None:
+    stats = db.get_statistics()
+    if stats['total_bets'] == 0:
+        print("\nNo bets recorded yet!")
+        return
+
+    display_statistics(stats)
+
+def handle_statistics_by_sport(db: Database) -> None:
+    sports = db.get_all_sports()
+    if not sports:
+        print("\nNo bets recorded yet!")
+        return
+
+    print("\nAvailable sports:")
+    for i, sport in enumerate(sports, 1):
+        print(f"{i}. {sport}")
+
+    sport_idx = int(input("\nEnter sport number: ")) - 1
+    if 0 <= sport_idx < len(sports):
+        stats = db.get_statistics_by_sport(sports[sport_idx])
+        display_statistics(stats, by_sport=True)
+    else:
+        print("Invalid sport number!")
+
+def handle_edit_pending(db: Database) -> None:
+    pending_bets = db.get_pending_bets()
+    if not pending_bets:
+        print("\nNo pending bets to edit!")
+        return
+
+    display_pending_bets(pending_bets)
+
+    bet_idx = int(input("\nEnter bet number to edit: ")) - 1
+    if 0 <= bet_idx < len(pending_bets):
+        bet = pending_bets[bet_idx]
+        bet_id = bet['id']
+        print("\nEnter new details (or press Enter to keep current value):")
+
+        # Get current values
+        current_sport = bet['sport']
+        current_team = bet['team']
+        current_odds = bet['odds']
+        current_amount = bet['amount']
+
+        # Get new values or keep current ones
+        new_sport = input(f"Sport [{current_sport}]: ") or current_sport
+        new_team = input(f"Team [{current_team}]: ") or current_team
+        new_odds_input = input(f"Odds [{current_odds:+}]: ")
+        new_odds = float(new_odds_input) if new_odds_input else current_odds
+        new_amount_input = input(f"Amount [${current_amount:.2f}]: ")
+        new_amount = float(new_amount_input) if new_amount_input else current_amount
+
+        if db.edit_pending_bet(bet_id, new_sport, new_team, new_odds, new_amount):
+            print("Bet updated successfully!")
+        else:
+            print("Failed to update bet. Please try again.")
+    else:
+        print("Invalid bet number!")
+
+def handle_remove_pending(db: Database) -> None:
+    pending_bets = db.get_pending_bets()
+    if not pending_bets:
+        print("\nNo pending bets to remove!")
+        return
+
+    display_pending_bets(pending_bets)
+
+    bet_idx = int(input("\nEnter bet number to remove: ")) - 1
+    if 0 <= bet_idx < len(pending_bets):
+        bet_id = pending_bets[bet_idx]['id']
+        confirm = get_yes_no_input(f"\nAre you sure you want to remove this bet? (y/n): ")
+        if confirm:
+            if db.remove_pending_bet(bet_id):
+                print("Bet removed successfully!")
             else:
-                print("Invalid bet number!")
-
-        elif choice == '7':
-            pending_bets = db.get_pending_bets_detailed()
-            summary = db.get_pending_bets_summary()
-            display_pending_bets_detailed(pending_bets, summary)
-            
-            if pending_bets:
-                input("\nPress Enter to continue...")
-            
-        elif choice == '8':
-            print("\nThank you for using Sports Betting Tracker!")
-            sys.exit(0)
-            
+                print("Failed to remove bet. Please try again.")
         else:
-            print("\nInvalid choice. Please try again.")
+            print("Bet removal cancelled.")
+    else:
+        print("Invalid bet number!")
+
+def handle_view_pending(db: Database) -> None:
+    pending_bets = db.get_pending_bets()
+    # The rows are already in memory, so aggregate here instead of
+    # re-scanning the pending set twice more in SQL for the summary.
+    summary = {
+        'count': len(pending_bets),
+        'total_pending': sum(row['amount'] for row in pending_bets),
+        'total_potential': sum(row['potential_win'] for row in pending_bets),
+        'sports_breakdown': Counter(row['sport'] for row in pending_bets).most_common()
+    }
+    display_pending_bets_detailed(pending_bets, summary)
+
+    if pending_bets:
+        input("\nPress Enter to continue...")
+
+def handle_exit(db: Database) -> None:
+    print("\nThank you for using Sports Betting Tracker!")
+    db.close()
+    sys.exit(0)
+
+def handle_invalid(db: Database) -> None:
+    print("\nInvalid choice. Please try again.")
+
+# O(1) jump table built once, instead of re-walking an if/elif chain on
+# every menu iteration.
+HANDLERS = {
+    '1': handle_new_bet,
+    '2': handle_update_result,
+    '3': handle_show_statistics,
+    '4': handle_statistics_by_sport,
+    '5': handle_edit_pending,
+    '6': handle_remove_pending,
+    '7': handle_view_pending,
+    '8': handle_exit,
+}
+
+# The menu never changes, so build the banner once and write it in one
+# call per iteration instead of reformatting eight prints each loop.
+MENU = (
+    "\nWhat would you like to do?\n"
+    "1. Enter a new bet\n"
+    "2. Update bet result\n"
+    "3. View overall statistics\n"
+    "4. View statistics by sport\n"
+    "5. Edit pending bet\n"
+    "6. Remove pending bet\n"
+    "7. View pending bets\n"
+    "8. Exit\n"
+)
+
+def main():
+    db = Database()
+    print("Welcome to the Sports Betting Tracker!")
+
+    while True:
+        sys.stdout.write(MENU)
+
+        choice = input("\nEnter your choice (1-8): ")
+
+        HANDLERS.get(choice, handle_invalid)(db)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()